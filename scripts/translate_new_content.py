@@ -13,20 +13,38 @@
 - TRANSLATE_API_TOKEN / OPENAI_API_KEY
 - TRANSLATE_API_MODEL / OPENAI_MODEL（必填）
 - TRANSLATE_MAX_WORKERS（可选，并发数）
+
+本地 watch 模式（python scripts/translate_new_content.py --watch）：
+- 只解析一次 hugo.toml，常驻线程池并按线程复用 HTTP 长连接（配置了代理时改用 urllib）。
+- 启动时按上面的提交时间规则建立新鲜度索引，工作区有改动的源文件也视为过期，
+  过期的源文件会立即翻译。
+- 轮询默认语言 contentDir，保存后经过防抖（--debounce 秒）只翻译被修改的文件。
+- 内存中记录每个源文件已翻译内容的哈希，未实际改动的保存不会重复翻译。
+- 不自动提交；在终端输入 commit 才会提交（并推送）源文件与译文。
+  有目标语言翻译失败时拒绝提交，输入 retry 重试；输入 quit 退出。
+- 源文件被删除或重命名时，只报告其遗留译文，不自动删除。
 """
 
 from __future__ import annotations
 
+import argparse
+import hashlib
+import http.client
 import json
 import os
+import queue
+import select
 import subprocess
 import sys
+import threading
+import time
 from concurrent.futures import Future, ThreadPoolExecutor, as_completed
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 from urllib.error import HTTPError, URLError
-from urllib.request import Request, urlopen
+from urllib.parse import urlsplit
+from urllib.request import Request, getproxies, proxy_bypass, urlopen
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 HUGO_CONFIG_PATH = REPO_ROOT / "hugo.toml"
@@ -34,6 +52,9 @@ MARKDOWN_EXTENSIONS = {".md", ".markdown"}
 DEFAULT_MAX_WORKERS = 8
 LARGE_SOURCE_SIZE_BYTES_THRESHOLD = 10 * 1024
 LARGE_SOURCE_MAX_TOKENS = 8 * 1024
+HTTP_TIMEOUT_SECONDS = 600
+DEFAULT_WATCH_INTERVAL_SECONDS = 1.0
+DEFAULT_WATCH_DEBOUNCE_SECONDS = 2.0
 
 LANGUAGE_NAME_FALLBACK = {
     "zh-cn": "Simplified Chinese",
@@ -71,6 +92,99 @@ class TranslationTask:
     target: LanguageConfig
 
 
+@dataclass
+class WatchState:
+    # 源文件路径 -> 最近一次扫描到的 mtime_ns
+    mtimes: dict[str, int]
+    # 源文件路径 -> 译文已是最新的源内容 sha256（内存中的新鲜度索引）
+    source_hashes: dict[str, str]
+    # 源文件路径 -> 最近一次变更的 monotonic 时间，用于防抖
+    pending: dict[str, float] = field(default_factory=dict)
+    # 源文件路径 -> (提交时的源内容哈希, 开始时间, 各目标语言的任务)
+    in_flight: dict[str, tuple[str, float, list[Future[tuple[str, bool]]]]] = field(
+        default_factory=dict
+    )
+    # 已全部翻译成功但尚未提交的源文件 -> 其有变更的译文
+    translated: dict[str, set[str]] = field(default_factory=dict)
+    # 部分目标语言翻译失败的源文件 -> 已写入工作区但不会被提交的译文
+    failed: dict[str, set[str]] = field(default_factory=dict)
+    # 退出时被取消、未翻译完的源文件
+    cancelled: set[str] = field(default_factory=set)
+
+
+class KeepAliveClient:
+    """按线程复用 HTTP(S) 长连接，供 watch 模式的常驻线程池使用。"""
+
+    def __init__(self, endpoint: str, timeout: float = HTTP_TIMEOUT_SECONDS) -> None:
+        parts = urlsplit(endpoint)
+        if parts.scheme not in {"http", "https"} or not parts.hostname:
+            raise RuntimeError(f"无法解析 API URL: {endpoint}")
+
+        self._https = parts.scheme == "https"
+        self._host = parts.hostname
+        self._port = parts.port
+        self._path = parts.path or "/"
+        if parts.query:
+            self._path += "?" + parts.query
+        self._timeout = timeout
+        self._local = threading.local()
+
+    def _connection(self) -> http.client.HTTPConnection:
+        conn = getattr(self._local, "conn", None)
+        # 空闲连接上可读说明服务端已关闭（或发来了意外数据），不再复用
+        if conn is not None and conn.sock is not None:
+            readable, _, _ = select.select([conn.sock], [], [], 0)
+            if readable:
+                self._reset()
+                conn = None
+        if conn is None:
+            conn_cls = (
+                http.client.HTTPSConnection
+                if self._https
+                else http.client.HTTPConnection
+            )
+            conn = conn_cls(self._host, self._port, timeout=self._timeout)
+            self._local.conn = conn
+        return conn
+
+    def _reset(self) -> None:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+        self._local.conn = None
+
+    def post(self, data: bytes, headers: dict[str, str]) -> str:
+        while True:
+            conn = self._connection()
+            reused = conn.sock is not None
+            try:
+                conn.request("POST", self._path, body=data, headers=headers)
+            except TimeoutError as exc:
+                self._reset()
+                raise RuntimeError(f"翻译接口连接超时: {exc}") from exc
+            except (http.client.HTTPException, OSError) as exc:
+                self._reset()
+                # 请求尚未发出即失败，说明复用的长连接已失效，换新连接重试一次
+                if reused:
+                    continue
+                raise RuntimeError(f"翻译接口连接失败: {exc}") from exc
+            break
+
+        # 请求已发出后不再重试，避免非幂等的 POST 被重复计费
+        try:
+            resp = conn.getresponse()
+            body = resp.read().decode("utf-8", errors="ignore")
+        except (http.client.HTTPException, OSError) as exc:
+            self._reset()
+            raise RuntimeError(f"翻译接口连接失败: {exc}") from exc
+
+        if resp.will_close:
+            self._reset()
+        if resp.status >= 400:
+            raise RuntimeError(f"翻译接口 HTTP {resp.status}: {body}")
+        return body
+
+
 def eprint(message: str) -> None:
     print(message, file=sys.stderr)
 
@@ -342,6 +456,7 @@ def translate_text(
     target_lang_key: str,
     target_lang_name: str,
     source_text: str,
+    client: KeepAliveClient | None = None,
 ) -> str:
     user_prompt = (
         f"源语言：{source_lang}\n"
@@ -365,24 +480,24 @@ def translate_text(
     if source_size_bytes > LARGE_SOURCE_SIZE_BYTES_THRESHOLD:
         payload["max_tokens"] = LARGE_SOURCE_MAX_TOKENS
 
-    req = Request(
-        endpoint,
-        data=json.dumps(payload).encode("utf-8"),
-        headers={
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {token}",
-        },
-        method="POST",
-    )
+    data = json.dumps(payload).encode("utf-8")
+    headers = {
+        "Content-Type": "application/json",
+        "Authorization": f"Bearer {token}",
+    }
 
-    try:
-        with urlopen(req, timeout=600) as resp:
-            body = resp.read().decode("utf-8")
-    except HTTPError as exc:
-        detail = exc.read().decode("utf-8", errors="ignore")
-        raise RuntimeError(f"翻译接口 HTTP {exc.code}: {detail}") from exc
-    except URLError as exc:
-        raise RuntimeError(f"翻译接口连接失败: {exc}") from exc
+    if client is not None:
+        body = client.post(data, headers)
+    else:
+        req = Request(endpoint, data=data, headers=headers, method="POST")
+        try:
+            with urlopen(req, timeout=HTTP_TIMEOUT_SECONDS) as resp:
+                body = resp.read().decode("utf-8")
+        except HTTPError as exc:
+            detail = exc.read().decode("utf-8", errors="ignore")
+            raise RuntimeError(f"翻译接口 HTTP {exc.code}: {detail}") from exc
+        except URLError as exc:
+            raise RuntimeError(f"翻译接口连接失败: {exc}") from exc
 
     try:
         parsed = json.loads(body)
@@ -417,19 +532,24 @@ def stage_files(paths: list[str]) -> None:
         raise RuntimeError(proc.stderr.strip() or "git add 执行失败")
 
 
-def commit_and_push(commit_message: str) -> None:
+def commit_and_push(commit_message: str) -> bool:
+    """提交并推送已暂存内容；没有可提交的内容时返回 False。"""
+    if run_git(["diff", "--cached", "--quiet"]).returncode == 0:
+        return False
+
     proc_commit = run_git(["commit", "-m", commit_message])
     if proc_commit.returncode != 0:
         stderr = (proc_commit.stderr or "").strip()
         stdout = (proc_commit.stdout or "").strip()
         merged = "\n".join([s for s in [stderr, stdout] if s]).strip()
         if "nothing to commit" in merged.lower() or "没有要提交的内容" in merged:
-            return
+            return False
         raise RuntimeError(merged or "git commit 执行失败")
 
     proc_push = run_git(["push"])
     if proc_push.returncode != 0:
         raise RuntimeError(proc_push.stderr.strip() or "git push 执行失败")
+    return True
 
 
 def resolve_max_workers(total_tasks: int) -> int:
@@ -458,6 +578,7 @@ def process_translation_task(
     model: str,
     source_lang: str,
     task: TranslationTask,
+    client: KeepAliveClient | None = None,
 ) -> tuple[str, bool]:
     target_path = normalize_rel_path(f"{task.target.content_dir}/{task.rel_path}")
     target_abs = REPO_ROOT / target_path
@@ -471,6 +592,7 @@ def process_translation_task(
             target_lang_key=task.target.key,
             target_lang_name=task.target.language_name,
             source_text=task.source_text,
+            client=client,
         )
     except Exception as exc:  # noqa: BLE001
         raise RuntimeError(
@@ -495,7 +617,504 @@ def process_translation_task(
     return target_path, True
 
 
-def main() -> int:
+def hash_text(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def scan_default_content_mtimes(
+    default_content_dir: str, target_content_dirs: list[str]
+) -> dict[str, int]:
+    """扫描工作区中的默认语言源文件（包含尚未跟踪的新文件），返回 路径 -> mtime_ns。"""
+    content_root = REPO_ROOT / default_content_dir
+    if not content_root.is_dir():
+        return {}
+
+    found: dict[str, int] = {}
+    for dirpath, dirnames, filenames in os.walk(content_root):
+        rel_dir = normalize_rel_path(Path(dirpath).relative_to(REPO_ROOT).as_posix())
+        dirnames[:] = [
+            d
+            for d in dirnames
+            if not any(is_subpath(f"{rel_dir}/{d}", t) for t in target_content_dirs)
+        ]
+        for name in filenames:
+            try:
+                found[normalize_rel_path(f"{rel_dir}/{name}")] = (
+                    (Path(dirpath) / name).stat().st_mtime_ns
+                )
+            except FileNotFoundError:
+                continue
+
+    sources = collect_default_content_files(
+        list(found), default_content_dir, target_content_dirs
+    )
+    return {path: found[path] for path in sources}
+
+
+def list_dirty_paths(path: str) -> set[str]:
+    """返回工作区中相对 HEAD 有改动或未跟踪的文件。"""
+    proc = run_git(
+        ["status", "--porcelain=v1", "-z", "--untracked-files=all", "--", path]
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip() or "git status 执行失败")
+
+    dirty: set[str] = set()
+    entries = iter(proc.stdout.split("\0"))
+    for entry in entries:
+        if len(entry) < 4:
+            continue
+        dirty.add(normalize_rel_path(entry[3:]))
+        # 重命名/复制条目后面紧跟原路径
+        if entry[0] in {"R", "C"}:
+            next(entries, None)
+    return dirty
+
+
+def endpoint_uses_proxy(endpoint: str) -> bool:
+    parts = urlsplit(endpoint)
+    if not getproxies().get(parts.scheme):
+        return False
+    return not proxy_bypass(parts.hostname or "")
+
+
+def find_stale_sources(
+    sources: list[str],
+    default_content_dir: str,
+    targets: list[LanguageConfig],
+    en_target: LanguageConfig,
+) -> list[str]:
+    """按 hook 的新鲜度规则找出译文过期的源文件。
+
+    工作区有改动的源文件尚无提交时间可比，改为按 mtime 判断：
+    任一目标译文缺失或比源文件旧时视为过期。
+    """
+    dirty = list_dirty_paths(default_content_dir)
+    stale: list[str] = []
+    for src_path in sources:
+        rel = get_relative_subpath(src_path, default_content_dir)
+        if src_path in dirty:
+            src_mtime = (REPO_ROOT / src_path).stat().st_mtime_ns
+            for target in targets:
+                target_abs = REPO_ROOT / normalize_rel_path(
+                    f"{target.content_dir}/{rel}"
+                )
+                if not target_abs.exists() or target_abs.stat().st_mtime_ns < src_mtime:
+                    stale.append(src_path)
+                    break
+            continue
+
+        en_path = normalize_rel_path(f"{en_target.content_dir}/{rel}")
+        if get_last_commit_timestamp(src_path) > get_last_commit_timestamp(en_path):
+            stale.append(src_path)
+    return stale
+
+
+def report_orphaned_translations(
+    src_path: str,
+    default_content_dir: str,
+    targets: list[LanguageConfig],
+) -> None:
+    rel = get_relative_subpath(src_path, default_content_dir)
+    orphaned = [
+        target_path
+        for target_path in (
+            normalize_rel_path(f"{t.content_dir}/{rel}") for t in targets
+        )
+        if (REPO_ROOT / target_path).exists()
+    ]
+    if orphaned:
+        eprint(
+            f"[translate-watch] 源文件已删除或重命名 {src_path}，"
+            + f"以下译文未自动处理，请手动确认: {', '.join(orphaned)}"
+        )
+
+
+def start_command_reader() -> queue.Queue[str | None]:
+    commands: queue.Queue[str | None] = queue.Queue()
+
+    def reader() -> None:
+        for line in sys.stdin:
+            commands.put(line.strip().lower())
+        commands.put(None)
+
+    threading.Thread(target=reader, name="watch-stdin", daemon=True).start()
+    return commands
+
+
+def poll_source_changes(
+    state: WatchState,
+    default_content_dir: str,
+    targets: list[LanguageConfig],
+    now: float,
+) -> None:
+    current = scan_default_content_mtimes(
+        default_content_dir, [t.content_dir for t in targets]
+    )
+
+    for src_path in set(state.mtimes) - set(current):
+        state.mtimes.pop(src_path, None)
+        state.source_hashes.pop(src_path, None)
+        state.pending.pop(src_path, None)
+        state.translated.pop(src_path, None)
+        state.failed.pop(src_path, None)
+        # 仍在翻译中的由 collect_finished_sources 在结束时报告
+        if src_path not in state.in_flight:
+            report_orphaned_translations(src_path, default_content_dir, targets)
+
+    for src_path, mtime in current.items():
+        if state.mtimes.get(src_path) != mtime:
+            state.mtimes[src_path] = mtime
+            state.pending[src_path] = now
+
+
+def dispatch_ready_sources(
+    state: WatchState,
+    executor: ThreadPoolExecutor,
+    client: KeepAliveClient | None,
+    endpoint: str,
+    token: str,
+    model: str,
+    default_lang: str,
+    default_content_dir: str,
+    targets: list[LanguageConfig],
+    debounce: float,
+    now: float,
+) -> None:
+    for src_path, changed_at in list(state.pending.items()):
+        # 同一文件的上一轮翻译结束前不重复派发，避免并发写同一译文
+        if now - changed_at < debounce or src_path in state.in_flight:
+            continue
+        del state.pending[src_path]
+
+        try:
+            source_text = read_repo_file(src_path)
+        except Exception as exc:  # noqa: BLE001
+            eprint(f"[translate-watch] 读取源文件失败 {src_path}: {exc}")
+            continue
+
+        source_hash = hash_text(source_text)
+        if state.source_hashes.get(src_path) == source_hash:
+            continue
+
+        rel = get_relative_subpath(src_path, default_content_dir)
+        if not rel:
+            continue
+
+        print(
+            f"[translate-watch] 翻译 {src_path} -> {', '.join(t.key for t in targets)}"
+        )
+        futures = [
+            executor.submit(
+                process_translation_task,
+                endpoint,
+                token,
+                model,
+                default_lang,
+                TranslationTask(
+                    src_path=src_path,
+                    source_text=source_text,
+                    rel_path=rel,
+                    target=target,
+                ),
+                client,
+            )
+            for target in targets
+        ]
+        state.in_flight[src_path] = (source_hash, time.monotonic(), futures)
+
+
+def collect_finished_sources(
+    state: WatchState,
+    default_content_dir: str,
+    targets: list[LanguageConfig],
+) -> None:
+    for src_path, (source_hash, started_at, futures) in list(state.in_flight.items()):
+        if not all(f.done() for f in futures):
+            continue
+        del state.in_flight[src_path]
+
+        failed = False
+        cancelled = False
+        changed: set[str] = set()
+        for future in futures:
+            if future.cancelled():
+                cancelled = True
+                continue
+            try:
+                target_path, target_changed = future.result()
+            except Exception as exc:  # noqa: BLE001
+                eprint(
+                    f"[translate-watch] 并发任务失败: {str(exc) or type(exc).__name__}"
+                )
+                failed = True
+                continue
+            if target_changed:
+                changed.add(target_path)
+
+        if src_path not in state.mtimes:
+            report_orphaned_translations(src_path, default_content_dir, targets)
+            continue
+
+        if cancelled:
+            # 只在退出时发生；部分译文已写入工作区，下次启动按 mtime 判定为过期
+            state.translated.pop(src_path, None)
+            state.failed.pop(src_path, None)
+            state.source_hashes.pop(src_path, None)
+            state.cancelled.add(src_path)
+            continue
+
+        if failed:
+            # 部分语言失败时整个源文件都不进入提交，等待 retry 或下次保存
+            state.failed[src_path] = (
+                state.failed.get(src_path, set())
+                | state.translated.pop(src_path, set())
+                | changed
+            )
+            state.source_hashes.pop(src_path, None)
+            eprint(
+                f"[translate-watch] {src_path} 有目标语言翻译失败，"
+                + "修复后输入 retry 重试或再次保存"
+            )
+            continue
+
+        state.source_hashes[src_path] = source_hash
+        state.translated[src_path] = (
+            state.translated.get(src_path, set())
+            | state.failed.pop(src_path, set())
+            | changed
+        )
+        print(
+            f"[translate-watch] 完成 {src_path}: 更新 {len(changed)} 个译文，"
+            + f"耗时 {time.monotonic() - started_at:.1f}s"
+        )
+
+
+def commit_watch_results(state: WatchState) -> None:
+    if state.in_flight or state.pending:
+        print("[translate-watch] 仍有文件等待或正在翻译，请稍后再提交")
+        return
+
+    if state.failed:
+        print(
+            "[translate-watch] 以下源文件有目标语言翻译失败，请先 retry: "
+            + ", ".join(sorted(state.failed))
+        )
+        return
+
+    if not state.translated:
+        print("[translate-watch] 没有待提交的翻译结果")
+        return
+
+    # 源文件与译文一并提交，使后续 hook 的提交时间比较不会再次翻译
+    sources = sorted(state.translated)
+    paths = sorted(set(sources).union(*state.translated.values()))
+    commit_message = "AI Translated " + " ".join(Path(p).name for p in sources)
+    try:
+        stage_files(paths)
+        committed = commit_and_push(commit_message)
+    except Exception as exc:  # noqa: BLE001
+        eprint(f"[translate-watch] 提交或推送失败: {exc}")
+        return
+
+    state.translated.clear()
+    if not committed:
+        print("[translate-watch] 翻译结果已在仓库中，没有新的提交")
+        return
+    print(
+        f"[translate-watch] 已提交并推送: {len(paths)} 个文件，"
+        + f"commit='{commit_message}'"
+    )
+
+
+def retry_failed_sources(state: WatchState) -> None:
+    if not state.failed:
+        print("[translate-watch] 没有翻译失败的源文件")
+        return
+    for src_path in state.failed:
+        state.pending[src_path] = float("-inf")
+    print(f"[translate-watch] 重新翻译 {len(state.failed)} 个源文件")
+
+
+def print_watch_status(state: WatchState) -> None:
+    print(
+        f"[translate-watch] 监视 {len(state.mtimes)} 个源文件，"
+        + f"等待 {len(state.pending)}，翻译中 {len(state.in_flight)}，"
+        + f"失败 {len(state.failed)}，未提交源文件 {len(state.translated)}"
+    )
+
+
+def watch(interval: float, debounce: float) -> int:
+    try:
+        default_lang, default_content_dir, targets = parse_hugo_languages(
+            HUGO_CONFIG_PATH
+        )
+    except Exception as exc:  # noqa: BLE001
+        eprint(f"[translate-watch] 读取 hugo.toml 失败: {exc}")
+        return 1
+
+    if not targets:
+        print("[translate-watch] 未检测到目标语言，退出")
+        return 0
+
+    en_target = next((t for t in targets if t.key == "en"), None)
+    if en_target is None:
+        eprint("[translate-watch] 未配置英文(en)语言目录，无法按英文译文时间比较")
+        return 1
+
+    try:
+        endpoint, token, model = resolve_api_env()
+    except Exception as exc:  # noqa: BLE001
+        eprint(f"[translate-watch] 环境变量错误: {exc}")
+        return 1
+
+    client: KeepAliveClient | None = None
+    if endpoint_uses_proxy(endpoint):
+        print("[translate-watch] 检测到代理配置，改用 urllib 请求（不复用连接）")
+    else:
+        try:
+            client = KeepAliveClient(endpoint)
+        except Exception as exc:  # noqa: BLE001
+            eprint(f"[translate-watch] 环境变量错误: {exc}")
+            return 1
+
+    try:
+        max_workers = resolve_max_workers(len(targets))
+    except Exception as exc:  # noqa: BLE001
+        eprint(f"[translate-watch] 并发配置错误: {exc}")
+        return 1
+
+    target_content_dirs = [t.content_dir for t in targets]
+    mtimes = scan_default_content_mtimes(default_content_dir, target_content_dirs)
+    try:
+        stale = set(
+            find_stale_sources(list(mtimes), default_content_dir, targets, en_target)
+        )
+    except Exception as exc:  # noqa: BLE001
+        eprint(f"[translate-watch] 检查译文新鲜度失败: {exc}")
+        return 1
+
+    state = WatchState(mtimes=mtimes, source_hashes={})
+    for src_path in mtimes:
+        if src_path in stale:
+            state.pending[src_path] = float("-inf")
+            continue
+        try:
+            state.source_hashes[src_path] = hash_text(read_repo_file(src_path))
+        except Exception as exc:  # noqa: BLE001
+            eprint(f"[translate-watch] 读取源文件失败 {src_path}: {exc}")
+
+    print(
+        f"[translate-watch] 监视 {default_content_dir}（{len(mtimes)} 个源文件，"
+        + f"{len(stale)} 个译文过期），目标语言: {', '.join(t.key for t in targets)}，"
+        + f"max_workers={max_workers}"
+    )
+    print(
+        "[translate-watch] 输入 commit 提交并推送，retry 重试失败项，"
+        + "status 查看状态，quit 退出"
+    )
+
+    commands = start_command_reader()
+    stdin_open = True
+    executor = ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="translate"
+    )
+    try:
+        while True:
+            now = time.monotonic()
+            poll_source_changes(state, default_content_dir, targets, now)
+            dispatch_ready_sources(
+                state,
+                executor,
+                client,
+                endpoint,
+                token,
+                model,
+                default_lang,
+                default_content_dir,
+                targets,
+                debounce,
+                now,
+            )
+            collect_finished_sources(state, default_content_dir, targets)
+
+            if not stdin_open:
+                time.sleep(interval)
+                continue
+
+            try:
+                command = commands.get(timeout=interval)
+            except queue.Empty:
+                continue
+
+            if command is None:
+                stdin_open = False
+            elif command in {"c", "commit"}:
+                commit_watch_results(state)
+            elif command in {"r", "retry"}:
+                retry_failed_sources(state)
+            elif command in {"s", "status"}:
+                print_watch_status(state)
+            elif command in {"q", "quit", "exit"}:
+                break
+            elif command:
+                print(f"[translate-watch] 未知命令: {command}")
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if state.in_flight:
+            print(
+                f"[translate-watch] 等待 {len(state.in_flight)} 个正在翻译的源文件结束..."
+            )
+        # 已发出的请求无法中断，取消排队任务并等待进行中的任务写完译文
+        executor.shutdown(wait=True, cancel_futures=True)
+        collect_finished_sources(state, default_content_dir, targets)
+
+    if state.cancelled:
+        print(
+            "[translate-watch] 退出时已取消，未翻译完: "
+            + ", ".join(sorted(state.cancelled))
+        )
+    if state.translated or state.failed:
+        print(
+            "[translate-watch] 退出，未提交的翻译结果保留在工作区: "
+            + f"{len(state.translated)} 个源文件，{len(state.failed)} 个失败"
+        )
+    return 0
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="自动翻译默认语言内容文件")
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="常驻监视默认语言 contentDir，保存后只翻译被修改的文件，不自动提交",
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=DEFAULT_WATCH_INTERVAL_SECONDS,
+        help=f"watch 模式轮询间隔秒数（默认 {DEFAULT_WATCH_INTERVAL_SECONDS}）",
+    )
+    parser.add_argument(
+        "--debounce",
+        type=float,
+        default=DEFAULT_WATCH_DEBOUNCE_SECONDS,
+        help=f"watch 模式防抖秒数，文件静止这么久后才翻译（默认 {DEFAULT_WATCH_DEBOUNCE_SECONDS}）",
+    )
+    args = parser.parse_args(argv)
+    if args.interval <= 0:
+        parser.error("--interval 必须大于 0")
+    if args.debounce < 0:
+        parser.error("--debounce 不能为负数")
+    return args
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    if args.watch:
+        return watch(args.interval, args.debounce)
+
     try:
         default_lang, default_content_dir, targets = parse_hugo_languages(
             HUGO_CONFIG_PATH
@@ -641,11 +1260,15 @@ def main() -> int:
     source_names = [Path(p).name for p in source_need_translate]
     commit_message = "AI Translated " + " ".join(source_names)
     try:
-        commit_and_push(commit_message)
+        committed = commit_and_push(commit_message)
     except Exception as exc:  # noqa: BLE001
         eprint(f"[translate-hook] 提交或推送失败: {exc}")
         return 1
 
+    if not committed:
+        print("[translate-hook] 暂存区无变更，未提交")
+        return 0
+
     print(
         f"[translate-hook] 已提交并推送翻译结果: {len(changed_unique)} 个文件，"
         + f"commit='{commit_message}'"